@@ -4,31 +4,65 @@ Deserialize SSZ files to human-readable format (JSON/YAML)
 
 Usage:
     python deserialize_ssz.py <ssz_file_path> [output_path]
+    python deserialize_ssz.py --print-full <ssz_file_path>
+    python deserialize_ssz.py --batch [--jobs N] [--fork FORK ...] [--type TYPE ...] [ssz_file_path ...]
+
+In batch mode, each input is written next to itself as {file}.yaml. If no paths
+are given on the command line, they are read from stdin (one per line). With
+--jobs N, files are processed by N worker processes (0 means one per CPU core).
+--fork and --type (repeatable) restrict the batch to files that resolve to the
+given forks/types; other files are skipped without being decoded.
 
 Example:
     python deserialize_ssz.py data/v1.6.0/tests/tests/mainnet/gloas/ssz_static/IndexedPayloadAttestation/ssz_random/case_0/serialized.ssz_snappy
+    find data/v1.6.0/tests -name '*.ssz_snappy' | python deserialize_ssz.py --batch
 """
 
 import sys
+import os
 import importlib
 import re
-import yaml
+import struct
+import functools
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from types import ModuleType
 
 # Import the debug tools from consensus-specs
 from eth2spec.debug.tools import get_ssz_object_from_ssz_encoded, output_ssz_to_file
 
-# Import SSZ types for defining Deltas
-from remerkleable.complex import Container, List
-from remerkleable.basic import uint64
+# Prefer cramjam's native snappy decoder when available; otherwise fall back to
+# the consensus-specs debug helper
+try:
+    import cramjam
+except ImportError:
+    cramjam = None
+
+@functools.lru_cache(maxsize=1)
+def _deltas_type():
+    """
+    Return the Deltas type for rewards tests (as specified in tests/formats/rewards/README.md).
+
+    Defined lazily so that runs which never see a rewards test don't pay for
+    building the container type or the eth2spec.phase0.mainnet import.
+    """
+    # Import SSZ types for defining Deltas
+    from remerkleable.complex import Container, List
+    from remerkleable.basic import uint64
+
+    # Import VALIDATOR_REGISTRY_LIMIT constant from specs
+    from eth2spec.phase0.mainnet import VALIDATOR_REGISTRY_LIMIT
 
-# Import VALIDATOR_REGISTRY_LIMIT constant from specs
-from eth2spec.phase0.mainnet import VALIDATOR_REGISTRY_LIMIT
+    class Deltas(Container):
+        rewards: List[uint64, VALIDATOR_REGISTRY_LIMIT]
+        penalties: List[uint64, VALIDATOR_REGISTRY_LIMIT]
 
-# Define Deltas type for rewards tests (as specified in tests/formats/rewards/README.md)
-class Deltas(Container):
-    rewards: List[uint64, VALIDATOR_REGISTRY_LIMIT]
-    penalties: List[uint64, VALIDATOR_REGISTRY_LIMIT]
+    return Deltas
+
+
+# Header of the PREVIOUS_FORK_OF dictionary in constants.py
+_PREVIOUS_FORK_OF_RE = re.compile(r'PREVIOUS_FORK_OF\s*=\s*\{')
 
 
 def load_previous_fork_mapping():
@@ -47,30 +81,84 @@ def load_previous_fork_mapping():
     # Parse PREVIOUS_FORK_OF dictionary
     previous_fork_of = {}
 
-    # Find the PREVIOUS_FORK_OF dictionary in the file
-    match = re.search(r'PREVIOUS_FORK_OF\s*=\s*\{([^}]+)\}', content, re.DOTALL)
+    # Find the PREVIOUS_FORK_OF dictionary in the file; its body runs up to the closing brace
+    match = _PREVIOUS_FORK_OF_RE.search(content)
     if match:
-        dict_content = match.group(1)
+        end = content.find('}', match.end())
+        dict_content = content[match.end():end] if end != -1 else ''
         # Parse lines like: ALTAIR: PHASE0,
-        for line in dict_content.split('\n'):
+        for line in dict_content.splitlines():
             line = line.strip()
-            if ':' in line and not line.startswith('#'):
-                parts = line.split(':')
-                if len(parts) == 2:
-                    key = parts[0].strip()
-                    value = parts[1].strip().rstrip(',')
-                    if value and value != 'None':
-                        # Convert to lowercase (e.g., ALTAIR -> altair)
-                        previous_fork_of[key.lower()] = value.lower()
+            if not line or line.startswith('#'):
+                continue
+            key, sep, value = line.partition(':')
+            if not sep or ':' in value:
+                continue
+            value = value.strip().rstrip(',')
+            if value and value != 'None':
+                # Convert to lowercase (e.g., ALTAIR -> altair)
+                previous_fork_of[key.strip().lower()] = value.lower()
 
     return previous_fork_of
 
 
-# Load fork mapping at module level
-PREVIOUS_FORK_OF = load_previous_fork_mapping()
+@functools.lru_cache(maxsize=1)
+def _previous_fork_of():
+    """Fork mapping, loaded on first use by fork/transition tests."""
+    return load_previous_fork_mapping()
+
+# Cache imported spec modules by (preset, fork)
+_MODULE_CACHE: dict[tuple[str, str], ModuleType] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_loader():
+    """Return the libyaml-backed CSafeLoader if available, else the pure-Python SafeLoader."""
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return loader
 
 
-def parse_ssz_path(file_path: Path):
+def _load_yaml(path: str):
+    """Parse a YAML file with the fastest available safe loader."""
+    import yaml
+
+    with open(path, 'rb') as f:
+        return yaml.load(f.read(), Loader=_yaml_loader())
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_meta(dir_str: str):
+    """
+    Load meta.yaml from a test case directory, or None if it doesn't exist.
+
+    Cached by directory since every blocks_*.ssz_snappy in a transition test
+    case reads the same meta.yaml.
+    """
+    meta_path = os.path.join(dir_str, 'meta.yaml')
+    if not os.path.exists(meta_path):
+        return None
+    return _load_yaml(meta_path)
+
+
+def _split_tests_path(path: str):
+    """
+    Return the path components after the first 'tests' directory, or None if
+    there is no such directory.
+    """
+    if os.sep != '/':
+        path = path.replace(os.sep, '/')
+    # Leading '/' so that a relative path starting with 'tests/' also matches
+    path = '/' + path
+    idx = path.find('/tests/')
+    if idx == -1:
+        return None
+    return path[idx + len('/tests/'):].split('/')
+
+
+def parse_ssz_path(file_path: str, verbose: bool = True):
     """
     Parse an SSZ file path to extract preset, fork, test_type, test_suite and derive type name.
 
@@ -84,97 +172,101 @@ def parse_ssz_path(file_path: Path):
     .../tests/{preset}/{fork}/{test_type}/{test_suite}/...
     The type is derived from the test_suite name (usually by capitalizing it)
 
+    Fork detection details and warnings are printed only when verbose is set.
+
     Returns:
         tuple: (preset, fork, type_name, filename)
     """
-    parts = file_path.parts
-
-    # Find the 'tests' directory index
-    tests_idx = -1
-    for i in range(len(parts)):
-        if parts[i] == 'tests':
-            tests_idx = i
-            break
+    # Path components after the first 'tests' directory:
+    # {preset}/{fork}/{test_type}/{test_suite}/...
+    parts = _split_tests_path(file_path)
 
-    if tests_idx == -1:
+    if parts is None:
         raise ValueError(f"Path must contain 'tests' directory: {file_path}")
 
-    # After 'tests', we expect: {preset}/{fork}/{test_type}/{test_suite}/...
-    if len(parts) < tests_idx + 5:
+    if len(parts) < 4:
         raise ValueError(f"Path too short, expected format: tests/{{preset}}/{{fork}}/{{test_type}}/{{test_suite}}/...: {file_path}")
 
-    preset = parts[tests_idx + 1]    # e.g., 'mainnet', 'minimal', 'general'
-    fork = parts[tests_idx + 2]      # e.g., 'phase0', 'altair', 'bellatrix', 'capella', 'deneb', 'eip7805'
-    test_type = parts[tests_idx + 3] # e.g., 'ssz_static', 'operations', 'epoch_processing'
-    test_suite = parts[tests_idx + 4] # e.g., 'attestation', 'BeaconState', 'justification_and_finalization'
+    preset = parts[0]     # e.g., 'mainnet', 'minimal', 'general'
+    fork = parts[1]       # e.g., 'phase0', 'altair', 'bellatrix', 'capella', 'deneb', 'eip7805'
+    test_type = parts[2]  # e.g., 'ssz_static', 'operations', 'epoch_processing'
+    test_suite = parts[3] # e.g., 'attestation', 'BeaconState', 'justification_and_finalization'
 
     # Get the filename to determine which SSZ object we're looking for
-    filename = file_path.name  # e.g., 'serialized.ssz_snappy', 'pre.ssz_snappy', 'post.ssz_snappy'
+    filename = os.path.basename(file_path)  # e.g., 'serialized.ssz_snappy', 'pre.ssz_snappy', 'post.ssz_snappy'
+
+    test_dir = os.path.dirname(file_path)
 
     # For fork tests with pre.ssz_snappy, use the previous fork
     actual_fork = fork
     if test_type == 'fork' and filename == 'pre.ssz_snappy':
-        if fork in PREVIOUS_FORK_OF:
-            actual_fork = PREVIOUS_FORK_OF[fork]
-            print(f"Fork test detected: using previous fork '{actual_fork}' for pre.ssz_snappy (current fork: '{fork}')")
-        else:
+        previous_fork_of = _previous_fork_of()
+        if fork in previous_fork_of:
+            actual_fork = previous_fork_of[fork]
+            if verbose:
+                print(f"Fork test detected: using previous fork '{actual_fork}' for pre.ssz_snappy (current fork: '{fork}')")
+        elif verbose:
             print(f"Warning: No previous fork found for '{fork}', using current fork")
 
     # For transition tests with pre.ssz_snappy, use the pre-fork
     if test_type == 'transition' and filename == 'pre.ssz_snappy':
-        # Read meta.yaml to get post_fork
-        meta_path = file_path.parent / 'meta.yaml'
-        if meta_path.exists():
-            with open(meta_path, 'r') as f:
-                meta = yaml.safe_load(f)
-                post_fork = meta.get('post_fork', fork).lower()
+        previous_fork_of = _previous_fork_of()
 
-                # Use previous fork of post_fork
-                if post_fork in PREVIOUS_FORK_OF:
-                    actual_fork = PREVIOUS_FORK_OF[post_fork]
+        # Read meta.yaml to get post_fork
+        meta = _load_meta(test_dir)
+        if meta is not None:
+            post_fork = meta.get('post_fork', fork).lower()
+
+            # Use previous fork of post_fork
+            if post_fork in previous_fork_of:
+                actual_fork = previous_fork_of[post_fork]
+                if verbose:
                     print(f"Transition test: using pre-fork '{actual_fork}' for pre.ssz_snappy (post_fork: '{post_fork}')")
-                else:
-                    print(f"Warning: No previous fork found for post_fork '{post_fork}', using current fork")
-        else:
-            print(f"Warning: meta.yaml not found at {meta_path}, using current fork '{fork}'")
+            elif verbose:
+                print(f"Warning: No previous fork found for post_fork '{post_fork}', using current fork")
+        elif verbose:
+            print(f"Warning: meta.yaml not found at {os.path.join(test_dir, 'meta.yaml')}, using current fork '{fork}'")
 
     # For transition tests with blocks_*.ssz_snappy, determine fork from meta.yaml
     if test_type == 'transition' and filename.startswith('blocks_'):
+        previous_fork_of = _previous_fork_of()
+
         # Parse block index from filename (e.g., blocks_0.ssz_snappy -> 0)
         try:
             block_index = int(filename.split('_')[1].split('.')[0])
 
             # Read meta.yaml to get fork_block and post_fork
-            meta_path = file_path.parent / 'meta.yaml'
-            if meta_path.exists():
-                with open(meta_path, 'r') as f:
-                    meta = yaml.safe_load(f)
-                    post_fork = meta.get('post_fork', fork).lower()
-                    fork_block = meta.get('fork_block')
-
-                    if fork_block is not None:
-                        if block_index <= fork_block:
-                            # Use pre-fork (previous fork of post_fork)
-                            if post_fork in PREVIOUS_FORK_OF:
-                                actual_fork = PREVIOUS_FORK_OF[post_fork]
+            meta = _load_meta(test_dir)
+            if meta is not None:
+                post_fork = meta.get('post_fork', fork).lower()
+                fork_block = meta.get('fork_block')
+
+                if fork_block is not None:
+                    if block_index <= fork_block:
+                        # Use pre-fork (previous fork of post_fork)
+                        if post_fork in previous_fork_of:
+                            actual_fork = previous_fork_of[post_fork]
+                            if verbose:
                                 print(f"Transition test: block {block_index} <= fork_block {fork_block}, using pre-fork '{actual_fork}'")
-                            else:
-                                print(f"Warning: No previous fork found for post_fork '{post_fork}'")
-                        else:
-                            # Use post-fork
-                            actual_fork = post_fork
-                            print(f"Transition test: block {block_index} > fork_block {fork_block}, using post-fork '{actual_fork}'")
+                        elif verbose:
+                            print(f"Warning: No previous fork found for post_fork '{post_fork}'")
                     else:
-                        print(f"Warning: fork_block not found in meta.yaml, using current fork '{fork}'")
-            else:
-                print(f"Warning: meta.yaml not found at {meta_path}, using current fork '{fork}'")
+                        # Use post-fork
+                        actual_fork = post_fork
+                        if verbose:
+                            print(f"Transition test: block {block_index} > fork_block {fork_block}, using post-fork '{actual_fork}'")
+                elif verbose:
+                    print(f"Warning: fork_block not found in meta.yaml, using current fork '{fork}'")
+            elif verbose:
+                print(f"Warning: meta.yaml not found at {os.path.join(test_dir, 'meta.yaml')}, using current fork '{fork}'")
         except (ValueError, IndexError) as e:
-            print(f"Warning: Could not parse block index from filename '{filename}': {e}")
+            if verbose:
+                print(f"Warning: Could not parse block index from filename '{filename}': {e}")
 
     # For light_client tests with fork transitions
     if test_type == 'light_client':
         # Get test case name from path (e.g., deneb_electra_reorg_aligned, deneb_fork)
-        test_case = parts[tests_idx + 6] if len(parts) > tests_idx + 6 else ''
+        test_case = parts[5] if len(parts) > 5 else ''
 
         # Initialize fork_names
         fork_names = []
@@ -190,7 +282,7 @@ def parse_ssz_path(file_path: Path):
         # Check if filename has epoch/slot number
         # Examples: update_100_*, finality_update_100_*, block_100_*
         has_slot_number = False
-        if any(filename.startswith(prefix) for prefix in ['update_', 'optimistic_update_', 'finality_update_', 'bootstrap_', 'block_']):
+        if filename.startswith(('update_', 'optimistic_update_', 'finality_update_', 'bootstrap_', 'block_')):
             try:
                 # Parse epoch/slot from filename
                 # Examples:
@@ -213,10 +305,9 @@ def parse_ssz_path(file_path: Path):
                 if epoch_or_slot is not None:
                     has_slot_number = True
                     # Read config.yaml to get fork epoch boundaries
-                    config_path = file_path.parent / 'config.yaml'
-                    if config_path.exists():
-                        with open(config_path, 'r') as f:
-                            config = yaml.safe_load(f)
+                    config_path = os.path.join(test_dir, 'config.yaml')
+                    if os.path.exists(config_path):
+                        config = _load_yaml(config_path)
 
                         # Get SLOTS_PER_EPOCH from config or preset
                         # Mainnet: 32, Minimal: 8
@@ -252,9 +343,11 @@ def parse_ssz_path(file_path: Path):
 
                         if selected_fork != fork:
                             actual_fork = selected_fork
-                            print(f"Light client {test_suite}: test '{test_case}' at slot {epoch_or_slot} (epoch {epoch}), using fork '{actual_fork}' (directory fork: '{fork}')")
+                            if verbose:
+                                print(f"Light client {test_suite}: test '{test_case}' at slot {epoch_or_slot} (epoch {epoch}), using fork '{actual_fork}' (directory fork: '{fork}')")
             except (ValueError, IndexError) as e:
-                print(f"Warning: Could not parse slot from light_client filename '{filename}': {e}")
+                if verbose:
+                    print(f"Warning: Could not parse slot from light_client filename '{filename}': {e}")
 
         # If no slot number in filename but fork names found in test case
         # (e.g., sync tests like "deneb_fork", "electra_fork", or update files with hashes)
@@ -267,7 +360,8 @@ def parse_ssz_path(file_path: Path):
             selected_fork = fork_names[-1]  # Use the last (newest) fork
             if selected_fork != fork:
                 actual_fork = selected_fork
-                print(f"Light client {test_suite}: test '{test_case}' using fork '{actual_fork}' (directory fork: '{fork}')")
+                if verbose:
+                    print(f"Light client {test_suite}: test '{test_case}' using fork '{actual_fork}' (directory fork: '{fork}')")
 
     # Determine type name based on test type
     if test_type == 'ssz_static':
@@ -276,9 +370,9 @@ def parse_ssz_path(file_path: Path):
     elif test_type in ['light_client', 'merkle_proof'] and test_suite == 'single_merkle_proof' and filename == 'object.ssz_snappy':
         # For light_client/single_merkle_proof and merkle_proof/single_merkle_proof:
         # Path format: .../light_client/single_merkle_proof/{TypeName}/test_name/object.ssz_snappy
-        # The TypeName is at parts[tests_idx + 5]
-        if len(parts) > tests_idx + 5:
-            type_name = parts[tests_idx + 5]
+        # The TypeName is at parts[4]
+        if len(parts) > 4:
+            type_name = parts[4]
         else:
             raise ValueError(f"Path too short for light_client/merkle_proof single_merkle_proof test: {file_path}")
     else:
@@ -289,6 +383,146 @@ def parse_ssz_path(file_path: Path):
     return preset, actual_fork, type_name, filename
 
 
+# Filenames whose type is the same in every test type
+_FILENAME_TYPES = {
+    # pre/post state files are always BeaconState
+    'pre.ssz_snappy': 'BeaconState',
+    'post.ssz_snappy': 'BeaconState',
+    'pre_epoch.ssz_snappy': 'BeaconState',
+    'post_epoch.ssz_snappy': 'BeaconState',
+    'initial_state.ssz_snappy': 'BeaconState',
+    # body.ssz_snappy is always BeaconBlockBody
+    'body.ssz_snappy': 'BeaconBlockBody',
+    # signed_envelope.ssz_snappy is always SignedExecutionPayloadEnvelope
+    'signed_envelope.ssz_snappy': 'SignedExecutionPayloadEnvelope',
+}
+
+# Fork choice tests (also used by sync tests)
+_FORK_CHOICE_RULES = (
+    {
+        'anchor_state.ssz_snappy': 'BeaconState',
+        'anchor_block.ssz_snappy': 'BeaconBlock',  # Unsigned
+    },
+    (
+        ('block_', 'SignedBeaconBlock'),
+        ('attestation_', 'Attestation'),
+        ('attester_slashing_', 'AttesterSlashing'),
+        ('pow_block_', 'PowBlock'),
+        ('column_', 'DataColumnSidecar'),
+        ('blobs_', 'BlobSidecar'),
+    ),
+    (),
+)
+
+# Rules scoped to a test type, keyed by (test_type, test_suite) or (test_type, None)
+# for rules that apply to every suite of that type. Each rule is a tuple of
+# (exact filename -> type, (prefix, type) pairs, (suffix, type) pairs), checked in that order.
+_SCOPED_RULES = {
+    ('fork_choice', None): _FORK_CHOICE_RULES,
+    ('sync', None): _FORK_CHOICE_RULES,
+    # Light client data_collection tests
+    ('light_client', 'data_collection'): (
+        {},
+        (
+            ('block_', 'SignedBeaconBlock'),
+            ('update_', 'LightClientUpdate'),
+            ('optimistic_update_', 'LightClientOptimisticUpdate'),
+            ('finality_update_', 'LightClientFinalityUpdate'),
+            ('bootstrap_', 'LightClientBootstrap'),
+        ),
+        (),
+    ),
+    # update_ranking tests have update_* and updates_* files (List of LightClientUpdate)
+    ('light_client', 'update_ranking'): (
+        {},
+        (
+            ('update_', 'LightClientUpdate'),
+            ('updates_', 'LightClientUpdate'),
+        ),
+        (),
+    ),
+    # Light client sync tests have various light client files
+    ('light_client', 'sync'): (
+        {'bootstrap.ssz_snappy': 'LightClientBootstrap'},
+        (
+            ('update_', 'LightClientUpdate'),
+            ('optimistic_update_', 'LightClientOptimisticUpdate'),
+            ('finality_update_', 'LightClientFinalityUpdate'),
+            ('bootstrap_', 'LightClientBootstrap'),
+        ),
+        (),
+    ),
+    # Rewards tests - deltas files
+    ('rewards', None): ({}, (), (('_deltas.ssz_snappy', 'Deltas'),)),
+    # Genesis tests - deposits and state files
+    ('genesis', None): (
+        {
+            'state.ssz_snappy': 'BeaconState',
+            'genesis.ssz_snappy': 'BeaconState',
+        },
+        (('deposits_', 'Deposit'),),
+        (),
+    ),
+    # In operations/block_header and operations/execution_payload_bid, block.ssz_snappy is BeaconBlock (unsigned)
+    ('operations', 'block_header'): ({'block.ssz_snappy': 'BeaconBlock'}, (), ()),
+    ('operations', 'execution_payload_bid'): ({'block.ssz_snappy': 'BeaconBlock'}, (), ()),
+}
+
+# For operations tests, the test_suite is usually the operation name
+# and maps directly to the SSZ type (with proper capitalization)
+_OPERATION_TYPES = {
+    'attestation': 'Attestation',
+    'attester_slashing': 'AttesterSlashing',
+    'block_header': 'BeaconBlock',  # Uses full BeaconBlock
+    'deposit': 'Deposit',
+    'proposer_slashing': 'ProposerSlashing',
+    'voluntary_exit': 'SignedVoluntaryExit',
+    'sync_aggregate': 'SyncAggregate',
+    'execution_payload': 'ExecutionPayload',
+    'withdrawals': 'ExecutionPayload',
+    'bls_to_execution_change': 'SignedBLSToExecutionChange',
+}
+
+
+def _compile_rules(rules):
+    """
+    Precompile a scoped rule tuple for _match_rules.
+
+    The prefixes become a single regex alternation (in rule order, so the first
+    listed prefix still wins) plus a prefix -> type dict, and the suffixes a
+    tuple for one str.endswith call.
+    """
+    exact, prefixes, suffixes = rules
+    prefix_re = re.compile('|'.join(re.escape(prefix) for prefix, _ in prefixes)) if prefixes else None
+    return exact, prefix_re, dict(prefixes), tuple(suffix for suffix, _ in suffixes), dict(suffixes)
+
+
+_COMPILED_RULES = {key: _compile_rules(rules) for key, rules in _SCOPED_RULES.items()}
+
+
+def _match_rules(rules, filename: str):
+    """Return the type for filename from a compiled rule tuple, or None."""
+    exact, prefix_re, prefix_types, suffixes, suffix_types = rules
+    type_name = exact.get(filename)
+    if type_name is not None:
+        return type_name
+    if prefix_re is not None:
+        match = prefix_re.match(filename)
+        if match:
+            return prefix_types[match.group()]
+    if suffixes and filename.endswith(suffixes):
+        for suffix in suffixes:
+            if filename.endswith(suffix):
+                return suffix_types[suffix]
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _pascal_case(name: str) -> str:
+    """Convert snake_case to PascalCase (e.g., 'sync_aggregate' -> 'SyncAggregate')."""
+    return ''.join(word.capitalize() for word in name.split('_'))
+
+
 def derive_type_from_suite(test_type: str, test_suite: str, filename: str) -> str:
     """
     Derive the SSZ type name from test_type and test_suite.
@@ -300,131 +534,27 @@ def derive_type_from_suite(test_type: str, test_suite: str, filename: str) -> st
         test_suite: The test suite name (e.g., 'attestation', 'justification_and_finalization')
         filename: The SSZ filename (e.g., 'pre.ssz_snappy', 'post.ssz_snappy', 'blocks_0.ssz_snappy')
     """
-    # pre/post state files are always BeaconState
-    if filename in ['pre.ssz_snappy', 'post.ssz_snappy', 'pre_epoch.ssz_snappy', 'post_epoch.ssz_snappy', 'initial_state.ssz_snappy']:
-        return 'BeaconState'
-
-    # body.ssz_snappy is always BeaconBlockBody
-    if filename == 'body.ssz_snappy':
-        return 'BeaconBlockBody'
-
-    # signed_envelope.ssz_snappy is always SignedExecutionPayloadEnvelope
-    if filename == 'signed_envelope.ssz_snappy':
-        return 'SignedExecutionPayloadEnvelope'
-
-    # Fork choice tests (also used by sync tests)
-    if test_type in ['fork_choice', 'sync']:
-        if filename == 'anchor_state.ssz_snappy':
-            return 'BeaconState'
-        if filename == 'anchor_block.ssz_snappy':
-            return 'BeaconBlock'  # Unsigned
-        if filename.startswith('block_'):
-            return 'SignedBeaconBlock'
-        if filename.startswith('attestation_'):
-            return 'Attestation'
-        if filename.startswith('attester_slashing_'):
-            return 'AttesterSlashing'
-        if filename.startswith('pow_block_'):
-            return 'PowBlock'
-        if filename.startswith('column_'):
-            return 'DataColumnSidecar'
-        if filename.startswith('blobs_'):
-            return 'BlobSidecar'
-
-    # Light client tests
-    if test_type == 'light_client':
-        # data_collection tests with block_* files
-        if test_suite == 'data_collection' and filename.startswith('block_'):
-            return 'SignedBeaconBlock'
-
-        # single_merkle_proof with object.ssz_snappy
-        if test_suite == 'single_merkle_proof' and filename == 'object.ssz_snappy':
-            # Type is determined from the parent directory name
-            # Path format: .../single_merkle_proof/{TypeName}/test_name/object.ssz_snappy
-            # The test_suite in parse_ssz_path is actually the next level, which should be the type
-            # But we need to extract it differently - this will be handled in parse_ssz_path
-            pass  # Will be handled specially in parse_ssz_path
-
-        # update_ranking tests
-        if test_suite == 'update_ranking':
-            # These tests have update_* and updates_* files (List of LightClientUpdate)
-            if filename.startswith(('update_', 'updates_')):
-                return 'LightClientUpdate'
-
-        # sync tests
-        if test_suite == 'sync':
-            # These tests have various light client files
-            if filename.startswith('update_'):
-                return 'LightClientUpdate'
-            if filename.startswith('optimistic_update_'):
-                return 'LightClientOptimisticUpdate'
-            if filename.startswith('finality_update_'):
-                return 'LightClientFinalityUpdate'
-            if filename.startswith('bootstrap_') or filename == 'bootstrap.ssz_snappy':
-                return 'LightClientBootstrap'
-
-    # Merkle proof tests with object.ssz_snappy
-    if test_type == 'merkle_proof':
-        if test_suite == 'single_merkle_proof' and filename == 'object.ssz_snappy':
-            pass  # Will be handled specially in parse_ssz_path
-
-    # Rewards tests - deltas files
-    if test_type == 'rewards':
-        if filename.endswith('_deltas.ssz_snappy'):
-            return 'Deltas'
-
-    # Genesis tests - deposits files
-    if test_type == 'genesis':
-        if filename.startswith('deposits_'):
-            return 'Deposit'
-        if filename in ['state.ssz_snappy', 'genesis.ssz_snappy']:
-            return 'BeaconState'
-
-    # Light client tests - data_collection test suite
-    if test_type == 'light_client' and test_suite == 'data_collection':
-        if filename.startswith('update_'):
-            return 'LightClientUpdate'
-        if filename.startswith('optimistic_update_'):
-            return 'LightClientOptimisticUpdate'
-        if filename.startswith('finality_update_'):
-            return 'LightClientFinalityUpdate'
-        if filename.startswith('bootstrap_'):
-            return 'LightClientBootstrap'
-
-    # Check filename patterns - these apply across multiple test types
-    # In operations/block_header and operations/execution_payload_bid, block.ssz_snappy is BeaconBlock (unsigned)
-    if test_type == 'operations' and test_suite in ['block_header', 'execution_payload_bid'] and filename == 'block.ssz_snappy':
-        return 'BeaconBlock'
+    type_name = _FILENAME_TYPES.get(filename)
+    if type_name is not None:
+        return type_name
+
+    # Rules specific to this test type / test suite
+    # (light_client and merkle_proof single_merkle_proof objects are handled in parse_ssz_path)
+    rules = _COMPILED_RULES.get((test_type, test_suite)) or _COMPILED_RULES.get((test_type, None))
+    if rules is not None:
+        type_name = _match_rules(rules, filename)
+        if type_name is not None:
+            return type_name
 
     # In other tests, blocks_* and block.ssz_snappy are SignedBeaconBlock
     if filename.startswith('blocks_') or filename == 'block.ssz_snappy':
         return 'SignedBeaconBlock'
 
-    # For operations tests, the test_suite is usually the operation name
-    # and maps directly to the SSZ type (with proper capitalization)
-    if test_type == 'operations':
-        # Common operations: attestation, attester_slashing, block_header, deposit,
-        # proposer_slashing, voluntary_exit, etc.
-        # These map to: Attestation, AttesterSlashing, BeaconBlock, Deposit, etc.
-        type_map = {
-            'attestation': 'Attestation',
-            'attester_slashing': 'AttesterSlashing',
-            'block_header': 'BeaconBlock',  # Uses full BeaconBlock
-            'deposit': 'Deposit',
-            'proposer_slashing': 'ProposerSlashing',
-            'voluntary_exit': 'SignedVoluntaryExit',
-            'sync_aggregate': 'SyncAggregate',
-            'execution_payload': 'ExecutionPayload',
-            'withdrawals': 'ExecutionPayload',
-            'bls_to_execution_change': 'SignedBLSToExecutionChange',
-        }
-        if test_suite in type_map:
-            return type_map[test_suite]
+    if test_type == 'operations' and test_suite in _OPERATION_TYPES:
+        return _OPERATION_TYPES[test_suite]
 
     # Default: try capitalizing the test_suite name
-    # Convert snake_case to PascalCase
-    words = test_suite.split('_')
-    return ''.join(word.capitalize() for word in words)
+    return _pascal_case(test_suite)
 
 
 def get_ssz_type_class(preset: str, fork: str, type_name: str):
@@ -439,21 +569,30 @@ def get_ssz_type_class(preset: str, fork: str, type_name: str):
     Returns:
         The SSZ type class
     """
-    # Special case: Deltas is a test-only type from rewards tests (defined at top of this file)
+    # Special case: Deltas is a test-only type from rewards tests (defined in this file)
     if type_name == 'Deltas':
-        return Deltas
+        return _deltas_type()
 
     # Handle 'general' preset - it uses mainnet types
     if preset == 'general':
         preset = 'mainnet'
 
+    return _get_spec_type_class(preset, fork, type_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_spec_type_class(preset: str, fork: str, type_name: str):
+    """Look up type_name in eth2spec.{fork}.{preset}, memoized per (preset, fork, type_name)."""
     # Build the module path: eth2spec.{fork}.{preset}
     module_path = f"eth2spec.{fork}.{preset}"
 
-    try:
-        module = importlib.import_module(module_path)
-    except ImportError as e:
-        raise ImportError(f"Failed to import module {module_path}: {e}")
+    module = _MODULE_CACHE.get((preset, fork))
+    if module is None:
+        try:
+            module = importlib.import_module(module_path)
+        except ImportError as e:
+            raise ImportError(f"Failed to import module {module_path}: {e}")
+        _MODULE_CACHE[(preset, fork)] = module
 
     # Get the type class from the module
     if not hasattr(module, type_name):
@@ -462,66 +601,180 @@ def get_ssz_type_class(preset: str, fork: str, type_name: str):
     return getattr(module, type_name)
 
 
-def deserialize_ssz_file(input_path: Path, output_path: Path = None):
+def read_ssz_snappy_bytes(input_path: Path):
     """
-    Deserialize an SSZ file and optionally save to output file.
+    Return the decompressed SSZ bytes of a .ssz_snappy file, or None if cramjam
+    is not available or the file is not snappy-compressed.
+
+    .ssz_snappy files use the snappy block (raw) format, so the file is read in
+    one call and decompressed in memory.
+    """
+    input_path = Path(input_path)
+    if cramjam is None or input_path.suffix != '.ssz_snappy':
+        return None
+    return bytes(cramjam.snappy.decompress_raw(input_path.read_bytes()))
+
+
+def decode_ssz_file(input_path: Path, ssz_type_class):
+    """
+    Decode an SSZ file into an instance of ssz_type_class.
+
+    With cramjam, .ssz_snappy files are decoded directly with decode_bytes.
+    Anything else goes through the consensus-specs helper.
+    """
+    raw = read_ssz_snappy_bytes(input_path)
+    if raw is not None:
+        return ssz_type_class.decode_bytes(raw)
+
+    return get_ssz_object_from_ssz_encoded(input_path, ssz_type_class)
+
+
+def _uint64_list(raw: bytes, start: int, end: int):
+    """Read raw[start:end] as a list of little-endian uint64 values."""
+    values = array('Q')
+    values.frombytes(memoryview(raw)[start:end])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
+
+
+def _decode_deltas_fast(raw: bytes):
+    """
+    Decode SSZ-encoded Deltas into {'rewards': [...], 'penalties': [...]}.
+
+    Deltas is a container of two List[uint64] fields, so its encoding is two
+    4-byte offsets followed by the packed rewards and penalties. Reading those
+    directly avoids building (and hashing) the remerkleable trees. Returns None
+    if the framing is not valid, so the caller can fall back to the full decoder.
+    """
+    if len(raw) < 8:
+        return None
+    rewards_offset, penalties_offset = struct.unpack_from('<II', raw, 0)
+    if rewards_offset != 8 or not rewards_offset <= penalties_offset <= len(raw):
+        return None
+    if (penalties_offset - rewards_offset) % 8 or (len(raw) - penalties_offset) % 8:
+        return None
+    return {
+        'rewards': _uint64_list(raw, rewards_offset, penalties_offset),
+        'penalties': _uint64_list(raw, penalties_offset, len(raw)),
+    }
+
+
+def export_deltas_fast(input_path: Path, output_path: Path):
+    """
+    Export a rewards Deltas file to YAML without going through remerkleable.
+
+    Only used for YAML output, where plain lists of ints serialize the same as
+    the SSZ lists. Returns the decoded dict, or None if the fast path does not
+    apply (non-YAML output, no cramjam, or unexpected framing).
+    """
+    output_path = Path(output_path)
+    if output_path.suffix not in ('.yaml', '.yml'):
+        return None
+    raw = read_ssz_snappy_bytes(input_path)
+    if raw is None:
+        return None
+    deltas = _decode_deltas_fast(raw)
+    if deltas is None:
+        return None
+
+    write_deltas_yaml(output_path, deltas['rewards'], deltas['penalties'])
+    return deltas
 
-    Args:
-        input_path: Path to the .ssz or .ssz_snappy file
-        output_path: Optional path to save the output (YAML or JSON based on extension)
+
+def _yaml_int_list(key: str, values) -> str:
+    """Format a list of ints as a block-style YAML sequence under key."""
+    if not values:
+        return f"{key}: []\n"
+    return f"{key}:\n- " + '\n- '.join(map(str, values)) + '\n'
+
+
+def write_deltas_yaml(output_path: Path, rewards, penalties):
+    """
+    Write Deltas rewards/penalties to YAML.
+
+    These lists can hold millions of entries, so the YAML is formatted with a
+    single join per list rather than by the YAML emitter, one node at a time.
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w') as f:
+        f.write(_yaml_int_list('rewards', rewards))
+        f.write(_yaml_int_list('penalties', penalties))
+
+
+def resolve_type(input_path: Path, verbose: bool = True):
+    """
+    Resolve the preset, fork and SSZ type name of a file from its path alone.
+
+    This is cheap (no spec imports or SSZ decoding), so callers can use it to
+    filter files before paying for decode_with_type.
 
     Returns:
-        The deserialized SSZ object
+        tuple: (preset, fork, type_name, filename)
     """
-    # Parse the path to get preset, fork, type name, and filename
-    preset, fork, type_name, filename = parse_ssz_path(input_path)
+    return parse_ssz_path(os.fspath(input_path), verbose)
+
+
+def decode_with_type(input_path: Path, preset: str, fork: str, type_name: str, verbose: bool = True):
+    """
+    Decode an SSZ file as the type resolved by resolve_type.
 
-    print(f"Detected configuration:")
-    print(f"  Preset: {preset}")
-    print(f"  Fork: {fork}")
-    print(f"  Type: {type_name}")
-    print(f"  File: {filename}")
-    print()
+    Light client sync tests may contain objects from either side of a fork
+    transition, so for those other forks named in the path are tried if
+    decoding with the resolved fork fails.
+
+    Returns:
+        tuple: (ssz_obj, fork) where fork is the fork that decoded successfully
+    """
+    input_str = os.fspath(input_path)
 
     # Check if this is a light_client sync test (these may need fork fallback)
-    is_light_client_sync = 'light_client' in str(input_path) and '/sync/' in str(input_path)
+    is_light_client_sync = 'light_client' in input_str and '/sync/' in input_str
     alternative_forks = []
 
     if is_light_client_sync:
         # Extract potential fork names from the path for fallback
-        path_lower = str(input_path).lower()
+        path_lower = input_str.lower()
         for potential_fork in ['deneb', 'electra', 'capella', 'bellatrix', 'altair']:
             if potential_fork in path_lower and potential_fork != fork:
                 alternative_forks.append(potential_fork)
 
     # Get the SSZ type class
     ssz_type_class = get_ssz_type_class(preset, fork, type_name)
-    print(f"Loaded type: {ssz_type_class}")
-    print()
+    if verbose:
+        print(f"Loaded type: {ssz_type_class}")
+        print()
 
     # Deserialize the SSZ file
-    print(f"Deserializing: {input_path}")
+    if verbose:
+        print(f"Deserializing: {input_path}")
     try:
-        ssz_obj = get_ssz_object_from_ssz_encoded(input_path, ssz_type_class)
-        print("Deserialization successful!")
-        print()
+        ssz_obj = decode_ssz_file(input_path, ssz_type_class)
+        if verbose:
+            print("Deserialization successful!")
+            print()
     except Exception as e:
         # If deserialization fails and we have alternative forks, try them
         if is_light_client_sync and alternative_forks:
-            print(f"Deserialization failed with {fork} fork: {e}")
-            print(f"Trying alternative forks: {alternative_forks}")
+            if verbose:
+                print(f"Deserialization failed with {fork} fork: {e}")
+                print(f"Trying alternative forks: {alternative_forks}")
 
             for alt_fork in alternative_forks:
                 try:
-                    print(f"  Trying fork: {alt_fork}")
+                    if verbose:
+                        print(f"  Trying fork: {alt_fork}")
                     ssz_type_class = get_ssz_type_class(preset, alt_fork, type_name)
-                    ssz_obj = get_ssz_object_from_ssz_encoded(input_path, ssz_type_class)
-                    print(f"Deserialization successful with {alt_fork} fork!")
+                    ssz_obj = decode_ssz_file(input_path, ssz_type_class)
                     fork = alt_fork  # Update fork for output
-                    print()
+                    if verbose:
+                        print(f"Deserialization successful with {alt_fork} fork!")
+                        print()
                     break
                 except Exception as alt_e:
-                    print(f"  Failed with {alt_fork}: {alt_e}")
+                    if verbose:
+                        print(f"  Failed with {alt_fork}: {alt_e}")
                     continue
             else:
                 # None of the alternative forks worked, re-raise original exception
@@ -529,52 +782,272 @@ def deserialize_ssz_file(input_path: Path, output_path: Path = None):
         else:
             raise
 
+    return ssz_obj, fork
+
+
+def export_ssz_object(output_path: Path, ssz_obj):
+    """Write ssz_obj to output_path (YAML or JSON based on extension), creating parent directories."""
+    output_path = Path(output_path)
+    if type(ssz_obj).__name__ == 'Deltas' and isinstance(ssz_obj, _deltas_type()) and output_path.suffix in ('.yaml', '.yml'):
+        write_deltas_yaml(output_path, [int(v) for v in ssz_obj.rewards], [int(v) for v in ssz_obj.penalties])
+        return
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_ssz_to_file(output_path, ssz_obj)
+
+
+def deserialize_ssz_file(input_path: Path, output_path: Path = None, verbose: bool = True, print_full: bool = False):
+    """
+    Deserialize an SSZ file and optionally save to output file.
+
+    Args:
+        input_path: Path to the .ssz or .ssz_snappy file
+        output_path: Optional path to save the output (YAML or JSON based on extension)
+        verbose: Print progress and fork/type detection details (disabled in batch mode)
+        print_full: Without output_path, print the full object instead of a summary
+
+    Returns:
+        The deserialized SSZ object (for Deltas exported to YAML, a plain dict
+        of rewards/penalties lists)
+    """
+    # Parse the path to get preset, fork, type name, and filename
+    preset, fork, type_name, filename = resolve_type(input_path, verbose)
+
+    if verbose:
+        print(f"Detected configuration:")
+        print(f"  Preset: {preset}")
+        print(f"  Fork: {fork}")
+        print(f"  Type: {type_name}")
+        print(f"  File: {filename}")
+        print()
+
+    # Rewards Deltas exported to YAML don't need the SSZ tree at all
+    if type_name == 'Deltas' and output_path:
+        deltas = export_deltas_fast(input_path, output_path)
+        if deltas is not None:
+            if verbose:
+                print(f"Exported to: {output_path}")
+            return deltas
+
+    ssz_obj, fork = decode_with_type(input_path, preset, fork, type_name, verbose)
+
     # Output to file if requested
     if output_path:
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_ssz_to_file(output_path, ssz_obj)
-        print(f"Exported to: {output_path}")
-    else:
-        # Print to console
-        print("Deserialized object:")
-        print(ssz_obj)
+        export_ssz_object(output_path, ssz_obj)
+        if verbose:
+            print(f"Exported to: {output_path}")
+    elif verbose:
+        # Print to console. The full repr of a large object (e.g. a mainnet
+        # BeaconState) is expensive to build, so only a summary is shown by default.
+        if print_full:
+            print("Deserialized object:")
+            print(ssz_obj)
+        else:
+            print(f"Deserialized object: {type(ssz_obj).__name__}: {len(ssz_obj.encode_bytes())} bytes")
+            print("(use --print-full to print the full object)")
 
     return ssz_obj
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python deserialize_ssz.py <ssz_file_path> [output_path]")
-        print()
-        print("Example:")
-        print("  python deserialize_ssz.py data/v1.6.0/tests/tests/mainnet/gloas/ssz_static/IndexedPayloadAttestation/ssz_random/case_0/serialized.ssz_snappy")
-        print("  python deserialize_ssz.py input.ssz_snappy output.yaml")
-        sys.exit(1)
+def process_batch_file(input_path: Path, forks=None, types=None):
+    """
+    Deserialize a single file as part of a batch, writing {file}.yaml next to it.
+
+    Args:
+        input_path: Path to the .ssz_snappy file
+        forks: Optional set of forks to keep; files resolving to other forks are skipped
+        types: Optional set of SSZ type names to keep; files resolving to other types are skipped
 
-    input_path = Path(sys.argv[1])
-    output_path = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+    Returns:
+        tuple: (status, message) where status is 'OK', 'SKIP' or 'ERR'
+    """
+    if not input_path.exists():
+        return 'ERR', f"Input file does not exist: {input_path}"
+
+    output_path = input_path.with_name(input_path.name + '.yaml')
+    try:
+        # Resolve from the path first so filtered-out files are never decoded
+        preset, fork, type_name, _ = resolve_type(input_path, verbose=False)
+        if forks and fork not in forks:
+            return 'SKIP', f"fork '{fork}' not selected"
+        if types and type_name not in types:
+            return 'SKIP', f"type '{type_name}' not selected"
+
+        if type_name == 'Deltas' and export_deltas_fast(input_path, output_path) is not None:
+            return 'OK', ''
+
+        ssz_obj, _ = decode_with_type(input_path, preset, fork, type_name, verbose=False)
+        export_ssz_object(output_path, ssz_obj)
+    except (ValueError, AttributeError, ImportError) as e:
+        # Same classification as single-file mode (exit code 2)
+        return 'SKIP', str(e)
+    except Exception as e:
+        return 'ERR', str(e)
+    return 'OK', ''
+
+
+def observed_spec_modules(paths):
+    """
+    Collect the (preset, fork) pairs referenced by a list of test paths.
+
+    Only the directory layout is inspected (no meta.yaml/config.yaml reads), so
+    this is cheap enough to run over the whole batch up front. Fork and
+    transition tests also need the previous fork (for pre.ssz_snappy), and
+    rewards tests need phase0/mainnet for the Deltas type.
+    """
+    needed = set()
+    for path in paths:
+        parts = _split_tests_path(os.fspath(path))
+        if parts is None or len(parts) < 2:
+            continue
+        preset, fork = parts[0], parts[1]
+        if preset == 'general':
+            preset = 'mainnet'
+        needed.add((preset, fork))
+
+        test_type = parts[2] if len(parts) > 2 else ''
+        if test_type in ('fork', 'transition'):
+            previous_fork = _previous_fork_of().get(fork)
+            if previous_fork:
+                needed.add((preset, previous_fork))
+        elif test_type == 'rewards':
+            needed.add(('mainnet', 'phase0'))
+    return needed
+
+
+def prewarm_spec_modules(needed):
+    """
+    Import eth2spec.{fork}.{preset} for each pair into the module cache.
+
+    Used as a worker initializer so that the (expensive) spec imports happen
+    once per worker rather than on each worker's first task.
+    """
+    for preset, fork in needed:
+        if (preset, fork) in _MODULE_CACHE:
+            continue
+        try:
+            _MODULE_CACHE[(preset, fork)] = importlib.import_module(f"eth2spec.{fork}.{preset}")
+        except ImportError:
+            # Unknown fork/preset; the file itself will be reported as skipped
+            pass
+
+
+def main_batch(args):
+    """
+    Deserialize many files in a single interpreter (or a pool of worker
+    processes with --jobs), so the eth2spec imports and module cache are shared
+    across files.
+
+    Args:
+        args: Command line arguments after --batch:
+              [--jobs N] [--fork FORK ...] [--type TYPE ...] [path ...].
+              If no paths are given, they are read from stdin (one per line)
+
+    Returns:
+        Exit code: 0 if no file errored, 1 otherwise
+    """
+    jobs = 1
+    forks = set()
+    types = set()
+    while args and args[0] in ('--jobs', '--fork', '--type'):
+        option = args[0]
+        if len(args) < 2:
+            print(f"Error: {option} requires a value", file=sys.stderr)
+            return 1
+        value = args[1]
+        args = args[2:]
+        if option == '--jobs':
+            if not value.isdigit():
+                print("Error: --jobs requires a non-negative integer", file=sys.stderr)
+                return 1
+            jobs = int(value) or os.cpu_count() or 1
+        elif option == '--fork':
+            forks.add(value)
+        else:
+            types.add(value)
+
+    paths = args or [line.strip() for line in sys.stdin if line.strip()]
+    process = functools.partial(process_batch_file, forks=forks, types=types)
+
+    if jobs > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=prewarm_spec_modules,
+            initargs=(observed_spec_modules(paths),),
+        )
+        results = executor.map(process, map(Path, paths), chunksize=16)
+    else:
+        executor = None
+        results = map(process, map(Path, paths))
+
+    counts = {'OK': 0, 'SKIP': 0, 'ERR': 0}
+    try:
+        for path, (status, message) in zip(paths, results):
+            counts[status] += 1
+            print(f"{status} {path}: {message}" if message else f"{status} {path}", flush=True)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    print(f"Done: {counts['OK']} ok, {counts['SKIP']} skipped, {counts['ERR']} errors", file=sys.stderr)
+    return 1 if counts['ERR'] else 0
+
+
+USAGE = """\
+Usage: python deserialize_ssz.py <ssz_file_path> [output_path]
+       python deserialize_ssz.py --print-full <ssz_file_path>
+       python deserialize_ssz.py --batch [--jobs N] [--fork FORK ...] [--type TYPE ...] [ssz_file_path ...]
+
+Example:
+  python deserialize_ssz.py data/v1.6.0/tests/tests/mainnet/gloas/ssz_static/IndexedPayloadAttestation/ssz_random/case_0/serialized.ssz_snappy
+  python deserialize_ssz.py input.ssz_snappy output.yaml
+  find data/v1.6.0/tests -name '*.ssz_snappy' | python deserialize_ssz.py --batch --jobs 0"""
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+
+    Returns:
+        Exit code: 0 on success, 2 if the file was skipped, 1 on error
+    """
+    args = sys.argv[1:] if argv is None else list(argv)
+
+    if args and args[0] == '--batch':
+        return main_batch(args[1:])
+
+    print_full = '--print-full' in args
+    if print_full:
+        args.remove('--print-full')
+
+    if not args:
+        print(USAGE)
+        return 1
+
+    input_path = Path(args[0])
+    output_path = Path(args[1]) if len(args) > 1 else None
 
     if not input_path.exists():
         print(f"Error: Input file does not exist: {input_path}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
     try:
-        deserialize_ssz_file(input_path, output_path)
+        deserialize_ssz_file(input_path, output_path, print_full=print_full)
     except (ValueError, AttributeError, ImportError) as e:
         # These are expected errors for tests that can't be deserialized
         # (e.g., ssz_generic tests, tests with unknown types, etc.)
         # Print the reason for debugging
         print(f"Skipping file: {e}", file=sys.stderr)
         # Exit with code 2 to indicate "skip this file"
-        sys.exit(2)
+        return 2
     except Exception as e:
         # Unexpected errors
         print(f"Error: {e}", file=sys.stderr)
         import traceback
         traceback.print_exc(file=sys.stderr)
-        sys.exit(1)
+        return 1
+
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())